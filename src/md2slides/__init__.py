@@ -1,7 +1,31 @@
 """md2slides - Convert Markdown files to PowerPoint presentations."""
 
-from md2slides.converter import MarkdownToPptxConverter
+from typing import TYPE_CHECKING
+
 from md2slides.parser import Image, MarkdownParser
 
+if TYPE_CHECKING:
+    # Visible to type checkers and IDEs; imported lazily at runtime below
+    from md2slides.converter import MarkdownToPptxConverter
+
 __version__ = "0.1.0"
 __all__ = ["MarkdownToPptxConverter", "MarkdownParser", "Image"]
+
+
+def __getattr__(name: str):
+    """Import the converter, and python-pptx/lxml with it, on first access.
+
+    Args:
+        name: The attribute being looked up on the package.
+
+    Returns:
+        The MarkdownToPptxConverter class.
+
+    Raises:
+        AttributeError: If name is not a lazily exported attribute.
+    """
+    if name == "MarkdownToPptxConverter":
+        from md2slides.converter import MarkdownToPptxConverter
+
+        return MarkdownToPptxConverter
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -7,9 +7,6 @@ import sys
 from pathlib import Path
 from typing import List, Optional
 
-from md2slides.converter import convert_file
-from md2slides.parser import ValidationError
-
 
 def main(args: Optional[List[str]] = None) -> int:
     """Main entry point for the CLI.
@@ -27,14 +24,18 @@ def main(args: Optional[List[str]] = None) -> int:
     parser.add_argument(
         "input",
         type=str,
-        help="Path to the input Markdown file",
+        nargs="+",
+        help="Path(s) to the input Markdown file(s)",
     )
     parser.add_argument(
         "-o",
         "--output",
         type=str,
         default=None,
-        help="Path for the output PPTX file (default: same as input with .pptx extension)",
+        help=(
+            "Path for the output PPTX file (default: same as input with .pptx "
+            "extension); only valid with a single input"
+        ),
     )
     parser.add_argument(
         "-v",
@@ -44,20 +45,34 @@ def main(args: Optional[List[str]] = None) -> int:
     )
 
     parsed_args = parser.parse_args(args)
+    if parsed_args.output is not None and len(parsed_args.input) > 1:
+        parser.error("-o/--output can only be used with a single input file")
+
+    # Deferred so --help/--version don't pay for importing python-pptx/lxml
+    from md2slides.converter import MarkdownToPptxConverter, convert_file
+    from md2slides.parser import ValidationError
 
-    try:
-        output_path = convert_file(parsed_args.input, parsed_args.output)
-        print(f"Created: {output_path}")
-        return 0
-    except FileNotFoundError as e:
-        print(f"Error: {e}", file=sys.stderr)
-        return 1
-    except ValidationError as e:
-        print(f"Validation error: {e}", file=sys.stderr)
-        return 1
-    except Exception as e:
-        print(f"Unexpected error: {e}", file=sys.stderr)
-        return 1
+    # One converter for every input, so the logo and template are loaded once.
+    # Created inside the try so a failing logo read is reported like any
+    # other conversion error; it is retried for the next input.
+    converter: Optional[MarkdownToPptxConverter] = None
+    exit_code = 0
+    for input_path in parsed_args.input:
+        try:
+            if converter is None:
+                converter = MarkdownToPptxConverter()
+            output_path = convert_file(input_path, parsed_args.output, converter)
+            print(f"Created: {output_path}")
+        except FileNotFoundError as e:
+            print(f"Error: {e}", file=sys.stderr)
+            exit_code = 1
+        except ValidationError as e:
+            print(f"Validation error: {e}", file=sys.stderr)
+            exit_code = 1
+        except Exception as e:
+            print(f"Unexpected error: {e}", file=sys.stderr)
+            exit_code = 1
+    return exit_code
 
 
 if __name__ == "__main__":
@@ -2,14 +2,21 @@
 
 from __future__ import annotations
 
+import io
 import os
+import stat
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import BinaryIO, List, Optional, Sequence, Tuple, Union
 
 from lxml import etree
 from pptx import Presentation
+from pptx.opc.constants import RELATIONSHIP_TYPE as RT
 from pptx.oxml.ns import qn
-from pptx.util import Inches, Pt
+from pptx.oxml.xmlchemy import OxmlElement
+from pptx.util import Emu, Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR, MSO_AUTO_SIZE
 
@@ -36,6 +43,7 @@ FONT_HEADER = "Montserrat"
 FONT_BODY = "Open Sans"
 
 # Logo settings (issue #4: make 30% smaller than previous 4.5")
+LOGO_FILENAME = "multiverse_logo.png"
 LOGO_WIDTH = Inches(3.15)  # 4.5 * 0.7 = 3.15 inches (30% smaller)
 LOGO_MARGIN = Inches(0.5)
 
@@ -43,6 +51,227 @@ LOGO_MARGIN = Inches(0.5)
 
 # Line spacing (issue #4: add half space between lines)
 LINE_SPACING_FACTOR = 1.5  # 1.0 = single, 1.5 = one and a half
+PARAGRAPH_SPACING = Pt(9)  # Half of 18pt = 9pt extra space
+
+# Slide dimensions (16:9 widescreen)
+SLIDE_WIDTH = Inches(13.333)
+SLIDE_HEIGHT = Inches(7.5)
+
+# Layout geometry, computed once at import rather than per slide
+TEXT_LEFT = Inches(0.5)
+TEXT_WIDTH = Inches(12.333)
+TITLE_SLIDE_TITLE_TOP = Inches(2.8)  # Adjusted for better centering
+TITLE_SLIDE_TITLE_HEIGHT = Inches(0.6)  # Single line title at 28pt needs ~0.5"
+TITLE_SLIDE_SUBTITLE_TOP = Inches(3.5)  # Closer to title (issue #4)
+TITLE_SLIDE_SUBTITLE_HEIGHT = Inches(0.5)
+CONTENT_TITLE_TOP = Inches(0.4)
+CONTENT_TITLE_HEIGHT = Inches(0.8)
+CONTENT_TOP = Inches(1.4)
+CONTENT_HEIGHT = Inches(5.6)
+CONTENT_WIDTH_WITH_IMAGE = Inches(5.666)  # Half of slide width minus margins
+IMAGE_LEFT = Inches(6.666)  # Start of right half
+IMAGE_WIDTH = Inches(6.167)  # Width of right half (13.333 - 0.5 - 6.666)
+CAPTION_HEIGHT = Inches(0.4)
+# At 3.15" width, logo height is approximately 0.55" (0.78 * 0.7)
+LOGO_HEIGHT_ESTIMATE = Inches(0.55)
+# Logo sits in the bottom-right corner with a margin; the slide size is fixed
+LOGO_LEFT = Emu(SLIDE_WIDTH - LOGO_WIDTH - LOGO_MARGIN)
+LOGO_TOP = Emu(SLIDE_HEIGHT - LOGO_HEIGHT_ESTIMATE - LOGO_MARGIN)
+
+# Write buffer used when saving the PPTX package
+SAVE_BUFFER_SIZE = 1024 * 1024
+
+# List indentation in EMU for hanging bullets (issue #12)
+LIST_INDENT_PER_LEVEL_EMU = int(Inches(0.5))
+LIST_HANGING_INDENT_EMU = int(Inches(0.25))
+
+# Clark-notation tag/attribute names used when writing XML directly
+_QN_BU_AUTO_NUM = qn('a:buAutoNum')
+_QN_BU_CHAR = qn('a:buChar')
+_QN_HLINK_CLICK = qn('a:hlinkClick')
+_QN_INDENT = qn('a:indent')
+_QN_LATIN = qn('a:latin')
+_QN_MAR_L = qn('a:marL')
+_QN_P = qn('a:p')
+_QN_P_PR = qn('a:pPr')
+_QN_R_ID = qn('r:id')
+_QN_R_PR = qn('a:rPr')
+_QN_SOLID_FILL = qn('a:solidFill')
+_QN_SPC_AFT = qn('a:spcAft')
+_QN_SPC_BEF = qn('a:spcBef')
+_QN_SPC_PTS = qn('a:spcPts')
+_QN_SRGB_CLR = qn('a:srgbClr')
+_QN_T = qn('a:t')
+
+# Paragraph spacing in centipoints, as written to a:spcPts/@val
+_PARAGRAPH_SPACING_VAL = str(PARAGRAPH_SPACING.centipoints)
+
+
+# Index of the "Blank" layout in python-pptx's default template
+_BLANK_LAYOUT_INDEX = 6
+
+
+@lru_cache(maxsize=None)
+def _template_bytes() -> bytes:
+    """Return a minimal 16:9 presentation template serialized to bytes.
+
+    Built once per process from python-pptx's default template: the slide
+    size is preset and every layout except "Blank" (the only one used) is
+    removed, so each conversion opens and later writes a smaller package.
+
+    Returns:
+        The template PPTX package as bytes.
+    """
+    prs = Presentation()
+    prs.slide_width = SLIDE_WIDTH
+    prs.slide_height = SLIDE_HEIGHT
+
+    layouts = prs.slide_layouts
+    blank_layout = layouts[_BLANK_LAYOUT_INDEX]
+    for layout in list(layouts):
+        if layout is not blank_layout:
+            layouts.remove(layout)
+
+    stream = io.BytesIO()
+    prs.save(stream)
+    return stream.getvalue()
+
+
+def _find_packaged_logo() -> Optional[str]:
+    """Find the logo shipped with the package or its source checkout.
+
+    Returns:
+        Path to logo file, or None if not found.
+    """
+    package_dir = Path(__file__).parent
+    for path in (
+        package_dir / "resources" / LOGO_FILENAME,
+        package_dir.parent.parent / "resources" / LOGO_FILENAME,
+    ):
+        if path.exists():
+            return str(path)
+    return None
+
+
+# Invariant for an installation, so probed once at import
+_PACKAGED_LOGO_PATH = _find_packaged_logo()
+
+
+def _add_spacing(pPr, tag: str) -> None:
+    """Add a PARAGRAPH_SPACING ``a:spcBef``/``a:spcAft`` child to ``a:pPr``.
+
+    Args:
+        pPr: The paragraph properties element.
+        tag: Qualified name of the spacing element to add.
+    """
+    spacing = etree.SubElement(pPr, tag)
+    etree.SubElement(spacing, _QN_SPC_PTS).set('val', _PARAGRAPH_SPACING_VAL)
+
+
+@lru_cache(maxsize=None)
+def _list_ppr_template(level: int, ordered: bool):
+    """Build the ``a:pPr`` shared by every list item of one kind and level.
+
+    Callers must ``deepcopy`` the result before inserting it into a slide.
+
+    Args:
+        level: The list nesting level (0 = top level).
+        ordered: True for numbered lists, False for bullets.
+
+    Returns:
+        A fully populated ``a:pPr`` element.
+    """
+    pPr = OxmlElement('a:pPr')
+
+    # Set indentation based on level
+    if level:
+        pPr.set('lvl', str(level))
+
+    # Set indentation for PowerPoint-native hanging indentation (issue #12)
+    # marL = left margin (where bullet sits)
+    # indent = negative for hanging (text starts to the right of bullet)
+    left_margin = LIST_INDENT_PER_LEVEL_EMU * (level + 1)
+    pPr.set(_QN_MAR_L, str(left_margin))
+    pPr.set(_QN_INDENT, str(-LIST_HANGING_INDENT_EMU))  # Negative = hanging indent
+
+    # Add line spacing - half space between lines (issue #4)
+    # Use space_after to add spacing after each paragraph
+    _add_spacing(pPr, _QN_SPC_AFT)
+
+    if ordered:
+        # Numbered list using buAutoNum
+        buAutoNum = etree.SubElement(pPr, _QN_BU_AUTO_NUM)
+        # Use different numbering styles for different levels
+        if level == 0:
+            buAutoNum.set('type', 'arabicPeriod')  # 1. 2. 3.
+        else:
+            buAutoNum.set('type', 'alphaLcPeriod')  # a. b. c.
+    else:
+        # Bullet point using buChar
+        buChar = etree.SubElement(pPr, _QN_BU_CHAR)
+        bullet_char = BULLET_CHARS[min(level, len(BULLET_CHARS) - 1)]
+        buChar.set('char', bullet_char)
+
+    return pPr
+
+
+@lru_cache(maxsize=None)
+def _spaced_ppr_template(space_before: bool):
+    """Build the ``a:pPr`` for text and section-title paragraphs.
+
+    Callers must ``deepcopy`` the result before inserting it into a slide.
+
+    Args:
+        space_before: Whether to add spacing before as well as after.
+
+    Returns:
+        An ``a:pPr`` element carrying paragraph spacing.
+    """
+    pPr = OxmlElement('a:pPr')
+    if space_before:
+        _add_spacing(pPr, _QN_SPC_BEF)
+    _add_spacing(pPr, _QN_SPC_AFT)
+    return pPr
+
+
+@lru_cache(maxsize=None)
+def _run_template(
+    size: Pt,
+    font_name: str,
+    color: RGBColor,
+    bold: bool,
+    italic: bool,
+    underline: bool,
+):
+    """Build an empty ``a:r`` carrying one combination of run formatting.
+
+    Callers must ``deepcopy`` the result before inserting it into a slide.
+
+    Args:
+        size: Font size.
+        font_name: Latin typeface name.
+        color: Solid text color.
+        bold: Whether the run is bold.
+        italic: Whether the run is italic.
+        underline: Whether the run is single-underlined.
+
+    Returns:
+        An ``a:r`` element with a populated ``a:rPr`` and an empty ``a:t``.
+    """
+    r = OxmlElement('a:r')
+    rPr = etree.SubElement(r, _QN_R_PR)
+    rPr.set('sz', str(size.centipoints))
+    rPr.set('b', '1' if bold else '0')
+    rPr.set('i', '1' if italic else '0')
+    if underline:
+        rPr.set('u', 'sng')
+    # Child order follows the CT_TextCharacterProperties schema; an
+    # a:hlinkClick, when needed, is appended after a:latin
+    solid_fill = etree.SubElement(rPr, _QN_SOLID_FILL)
+    etree.SubElement(solid_fill, _QN_SRGB_CLR).set('val', str(color))
+    etree.SubElement(rPr, _QN_LATIN).set('typeface', font_name)
+    etree.SubElement(r, _QN_T)
+    return r
 
 
 class MarkdownToPptxConverter:
@@ -56,7 +285,20 @@ class MarkdownToPptxConverter:
                 attempts to find logo in default locations.
         """
         self._prs: Presentation | None = None
+        # Per-presentation state, reset by convert()
+        self._blank_layout = None
+        # Content item type -> paragraph renderer, used by _render_content
+        self._content_renderers = {
+            ListItem: self._render_list_item,
+            SectionTitle: self._render_section_title,
+            TextRun: self._render_text_run,
+        }
         self._logo_path = self._find_logo_path(logo_path)
+        # Read once; every slide embeds the same bytes, so python-pptx's
+        # SHA1-keyed image part dedupe hits without touching the disk again
+        self._logo_bytes: Optional[bytes] = (
+            Path(self._logo_path).read_bytes() if self._logo_path else None
+        )
 
     def _find_logo_path(self, logo_path: Optional[str] = None) -> Optional[str]:
         """Find the logo file path.
@@ -67,20 +309,19 @@ class MarkdownToPptxConverter:
         Returns:
             Path to logo file, or None if not found.
         """
+        # The explicit and cwd paths are checked on every call (one stat
+        # each), as those logos may be created or removed while the process
+        # runs. The packaged logo is part of the installation, so it is
+        # deliberately resolved only once, at import.
         if logo_path and os.path.exists(logo_path):
             return logo_path
 
-        # Try default locations relative to package
-        package_dir = Path(__file__).parent
-        default_locations = [
-            package_dir / "resources" / "multiverse_logo.png",
-            package_dir.parent.parent / "resources" / "multiverse_logo.png",
-            Path.cwd() / "resources" / "multiverse_logo.png",
-        ]
+        if _PACKAGED_LOGO_PATH:
+            return _PACKAGED_LOGO_PATH
 
-        for path in default_locations:
-            if path.exists():
-                return str(path)
+        cwd_logo = Path.cwd() / "resources" / LOGO_FILENAME
+        if cwd_logo.exists():
+            return str(cwd_logo)
 
         return None
 
@@ -98,28 +339,53 @@ class MarkdownToPptxConverter:
             ValidationError: If markdown content or output path is invalid.
         """
         self._validate_output_path(output_path)
+        self._build_presentation(markdown_content)
+
+        # Ensure output directory exists
+        output_dir = os.path.dirname(output_path)
+        if output_dir:
+            os.makedirs(output_dir, exist_ok=True)
+
+        # Large write buffer: the zip writer emits many small chunks
+        with open(output_path, "wb", buffering=SAVE_BUFFER_SIZE) as stream:
+            self._prs.save(stream)
+        return os.path.abspath(output_path)
+
+    def convert_to_stream(self, markdown_content: str, stream: BinaryIO) -> None:
+        """Convert markdown content to PPTX, writing it to a binary stream.
+
+        Args:
+            markdown_content: The markdown string to convert.
+            stream: Writable binary file-like object, e.g. ``io.BytesIO``.
+
+        Raises:
+            ValidationError: If markdown content is invalid.
+        """
+        self._build_presentation(markdown_content)
+        self._prs.save(stream)
 
+    def _build_presentation(self, markdown_content: str) -> None:
+        """Parse markdown content and build its slides into a new presentation.
+
+        Args:
+            markdown_content: The markdown string to convert.
+
+        Raises:
+            ValidationError: If markdown content is invalid.
+        """
         parser = MarkdownParser(markdown_content)
-        slides = parser.parse()
 
-        self._prs = Presentation()
-        self._prs.slide_width = Inches(13.333)
-        self._prs.slide_height = Inches(7.5)
+        # The template is already 16:9 and holds only the blank layout
+        self._prs = Presentation(io.BytesIO(_template_bytes()))
+        self._blank_layout = self._prs.slide_layouts[0]
 
-        for slide_data in slides:
+        # Slides are built as the parser completes them
+        for slide_data in parser.iter_slides():
             if slide_data.is_title_slide:
                 self._create_title_slide(slide_data)
             else:
                 self._create_content_slide(slide_data)
 
-        # Ensure output directory exists
-        output_dir = os.path.dirname(output_path)
-        if output_dir:
-            os.makedirs(output_dir, exist_ok=True)
-
-        self._prs.save(output_path)
-        return os.path.abspath(output_path)
-
     def _validate_output_path(self, output_path: str) -> None:
         """Validate the output path.
 
@@ -144,26 +410,20 @@ class MarkdownToPptxConverter:
         Args:
             slide: The PowerPoint slide to add the logo to.
         """
-        if not self._logo_path:
+        if not self._logo_bytes:
             return
 
         # Position logo in bottom-right corner with proper margin
-        slide_width = self._prs.slide_width
-        slide_height = self._prs.slide_height
-
-        # Calculate logo position (bottom-right with margin)
-        # Logo is 3.15 inches (issue #4: 30% smaller than 4.5")
-        logo_left = slide_width - LOGO_WIDTH - LOGO_MARGIN
-        # Estimate logo height based on aspect ratio (scales with width)
-        # At 3.15" width, height is approximately 0.55" (0.78 * 0.7)
-        estimated_logo_height = Inches(0.55)
-        logo_top = slide_height - estimated_logo_height - LOGO_MARGIN
-
-        slide.shapes.add_picture(
-            self._logo_path,
-            logo_left,
-            logo_top,
-            width=LOGO_WIDTH
+        # Logo is 3.15 inches (issue #4: 30% smaller than 4.5").
+        # add_picture() dedupes image parts by SHA1, so every slide shares
+        # one logo part in the package
+        picture = slide.shapes.add_picture(
+            io.BytesIO(self._logo_bytes), LOGO_LEFT, LOGO_TOP, width=LOGO_WIDTH
+        )
+        # The image comes from a stream, so python-pptx falls back to a
+        # generic "image.png" alt text; keep the logo's file name instead
+        picture._element.nvPicPr.cNvPr.set(
+            "descr", os.path.basename(self._logo_path)
         )
 
     def _add_image_to_slide(self, slide, image: Image) -> None:
@@ -175,12 +435,6 @@ class MarkdownToPptxConverter:
         """
         from PIL import Image as PILImage
 
-        # Right half dimensions
-        right_half_left = Inches(6.666)  # Start of right half
-        right_half_width = Inches(6.167)  # Width of right half (13.333 - 0.5 - 6.666)
-        content_top = Inches(1.4)
-        content_height = Inches(5.6)
-
         # Check if image file exists
         image_path = Path(image.path)
         if not image_path.is_absolute():
@@ -201,11 +455,11 @@ class MarkdownToPptxConverter:
 
         # Calculate scaling to fit in right half
         # Account for caption space if present
-        caption_height_emu = Inches(0.4).emu if image.caption else 0
-        available_height_emu = content_height.emu - caption_height_emu
+        caption_height_emu = CAPTION_HEIGHT if image.caption else 0
+        available_height_emu = CONTENT_HEIGHT - caption_height_emu
 
         # Calculate scale factor to fit image in available space
-        target_width_emu = right_half_width.emu
+        target_width_emu = IMAGE_WIDTH
         target_height_emu = available_height_emu
 
         # Calculate aspect ratio
@@ -221,13 +475,13 @@ class MarkdownToPptxConverter:
             scaled_width_emu = int(target_height_emu * aspect_ratio)
 
         # Center image horizontally within right half
-        image_left = right_half_left.emu + (target_width_emu - scaled_width_emu) // 2
+        image_left = IMAGE_LEFT + (target_width_emu - scaled_width_emu) // 2
 
         # Position image (account for caption above)
         if image.caption:
-            image_top = content_top.emu + caption_height_emu
+            image_top = CONTENT_TOP + caption_height_emu
         else:
-            image_top = content_top.emu
+            image_top = CONTENT_TOP
 
         # Center image vertically in remaining space
         remaining_height_emu = available_height_emu - scaled_height_emu
@@ -244,20 +498,127 @@ class MarkdownToPptxConverter:
 
         # Add caption if present
         if image.caption:
-            caption_shape = slide.shapes.add_textbox(
-                right_half_left, content_top, right_half_width, Inches(0.4)
+            self._add_text_shape(
+                slide,
+                (IMAGE_LEFT, CONTENT_TOP, IMAGE_WIDTH, CAPTION_HEIGHT),
+                image.caption,
+                PP_ALIGN.CENTER,
+                FONT_SIZE_BODY,
+                FONT_BODY,
+                BRAND_DARK_GREY,
+                italic=True,
+            )
+
+    def _add_text_frame(self, slide, box: Tuple[int, int, int, int], auto_size=None):
+        """Add a word-wrapping text box to a slide.
+
+        Args:
+            slide: The PowerPoint slide to add the text box to.
+            box: The (left, top, width, height) of the text box in EMU.
+            auto_size: Optional MSO_AUTO_SIZE behaviour for the text frame.
+
+        Returns:
+            The new text box's text frame.
+        """
+        text_frame = slide.shapes.add_textbox(*box).text_frame
+        text_frame.word_wrap = True
+        if auto_size is not None:
+            text_frame.auto_size = auto_size
+        return text_frame
+
+    def _add_text_shape(
+        self,
+        slide,
+        box: Tuple[int, int, int, int],
+        text: str,
+        alignment: PP_ALIGN,
+        size: Pt,
+        font_name: str,
+        color: RGBColor,
+        bold: bool = False,
+        italic: bool = False,
+        auto_size=None,
+    ) -> None:
+        """Add a text box holding a single styled, aligned run of text.
+
+        Args:
+            slide: The PowerPoint slide to add the text box to.
+            box: The (left, top, width, height) of the text box in EMU.
+            text: The text to show.
+            alignment: Paragraph alignment.
+            size: Font size.
+            font_name: Latin typeface name.
+            color: Solid text color.
+            bold: Whether the text is bold.
+            italic: Whether the text is italic.
+            auto_size: Optional MSO_AUTO_SIZE behaviour for the text frame.
+        """
+        paragraph = self._add_text_frame(slide, box, auto_size).paragraphs[0]
+        paragraph.alignment = alignment
+        self._add_run(
+            paragraph._p, text, size, font_name, color, bold=bold, italic=italic
+        )
+
+    def _add_run(
+        self,
+        p,
+        text: str,
+        size: Pt,
+        font_name: str,
+        color: RGBColor,
+        bold: bool = False,
+        italic: bool = False,
+        hyperlink_rId: Optional[str] = None,
+    ) -> None:
+        """Append a fully styled ``a:r`` element to a paragraph.
+
+        The run is a copy of a cached template for its style, so only the
+        text and any hyperlink are filled in per run.
+
+        Args:
+            p: The ``a:p`` paragraph element to append to.
+            text: The run text.
+            size: Font size.
+            font_name: Latin typeface name.
+            color: Solid text color.
+            bold: Whether the run is bold.
+            italic: Whether the run is italic.
+            hyperlink_rId: Relationship id of an external hyperlink; linked
+                runs are also underlined.
+        """
+        r = deepcopy(
+            _run_template(size, font_name, color, bold, italic, bool(hyperlink_rId))
+        )
+        if hyperlink_rId:
+            etree.SubElement(r[0], _QN_HLINK_CLICK).set(_QN_R_ID, hyperlink_rId)
+        p.append(r)
+        # CT_RegularTextRun.text escapes XML-illegal control characters
+        r.text = text
+
+    def _add_text_runs(self, p, part, runs: List[TextRun], color: RGBColor) -> None:
+        """Append body-styled runs for parsed text, relating any hyperlinks.
+
+        Args:
+            p: The ``a:p`` paragraph element to append to.
+            part: The slide part owning hyperlink relationships.
+            runs: The parsed text runs.
+            color: Text color for runs that are not hyperlinks.
+        """
+        for text_run in runs:
+            rId = None
+            if text_run.url:
+                rId = part.relate_to(text_run.url, RT.HYPERLINK, is_external=True)
+            # Apply hyperlink styling if URL present
+            self._add_run(
+                p,
+                text_run.text,
+                FONT_SIZE_BODY,
+                FONT_BODY,
+                LINK_COLOR if rId else color,
+                bold=text_run.bold,
+                italic=text_run.italic,
+                hyperlink_rId=rId,
             )
-            caption_frame = caption_shape.text_frame
-            caption_frame.word_wrap = True
-
-            caption_para = caption_frame.paragraphs[0]
-            caption_para.alignment = PP_ALIGN.CENTER
-            caption_run = caption_para.add_run()
-            caption_run.text = image.caption
-            caption_run.font.size = FONT_SIZE_BODY
-            caption_run.font.name = FONT_BODY
-            caption_run.font.italic = True
-            caption_run.font.color.rgb = BRAND_DARK_GREY
 
     def _set_slide_background(self, slide) -> None:
         """Set the slide background to brand color.
@@ -270,61 +631,58 @@ class MarkdownToPptxConverter:
         fill.solid()
         fill.fore_color.rgb = BRAND_CATSKILL_WHITE
 
+    def _new_slide(self):
+        """Add a blank slide with the brand background applied.
+
+        Returns:
+            The new PowerPoint slide.
+        """
+        slide = self._prs.slides.add_slide(self._blank_layout)
+
+        # Apply brand background
+        self._set_slide_background(slide)
+        return slide
+
     def _create_title_slide(self, slide_data: Slide) -> None:
         """Create a title slide.
 
         Args:
             slide_data: The slide data to render.
         """
-        blank_layout = self._prs.slide_layouts[6]  # Blank layout
-        slide = self._prs.slides.add_slide(blank_layout)
-
-        # Apply brand background
-        self._set_slide_background(slide)
+        slide = self._new_slide()
 
         # Title text box - fit to text size (issue #4)
-        title_left = Inches(0.5)
-        title_top = Inches(2.8)  # Adjusted for better centering
-        title_width = Inches(12.333)
-        # Height fits the text - single line title at 28pt needs ~0.5"
-        title_height = Inches(0.6)
-
-        title_shape = slide.shapes.add_textbox(
-            title_left, title_top, title_width, title_height
+        self._add_text_shape(
+            slide,
+            (TEXT_LEFT, TITLE_SLIDE_TITLE_TOP, TEXT_WIDTH, TITLE_SLIDE_TITLE_HEIGHT),
+            slide_data.title,
+            PP_ALIGN.CENTER,
+            FONT_SIZE_H1,
+            FONT_HEADER,
+            BRAND_WOODSMOKE,
+            bold=True,
+            auto_size=MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT,
         )
-        title_frame = title_shape.text_frame
-        title_frame.word_wrap = True
-        title_frame.auto_size = MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT
-
-        title_para = title_frame.paragraphs[0]
-        title_para.alignment = PP_ALIGN.CENTER
-        title_run = title_para.add_run()
-        title_run.text = slide_data.title
-        title_run.font.size = FONT_SIZE_H1
-        title_run.font.bold = True
-        title_run.font.name = FONT_HEADER
-        title_run.font.color.rgb = BRAND_WOODSMOKE
 
         # Subtitle text box (if present) - closer to title, dark grey (issue #4)
         if slide_data.subtitle:
             # Position subtitle closer to title (0.3" gap instead of 1.7")
-            subtitle_top = Inches(3.5)  # Closer to title
-            subtitle_height = Inches(0.5)
-
-            subtitle_shape = slide.shapes.add_textbox(
-                title_left, subtitle_top, title_width, subtitle_height
+            # Dark grey (issue #4)
+            self._add_text_shape(
+                slide,
+                (
+                    TEXT_LEFT,
+                    TITLE_SLIDE_SUBTITLE_TOP,
+                    TEXT_WIDTH,
+                    TITLE_SLIDE_SUBTITLE_HEIGHT,
+                ),
+                slide_data.subtitle,
+                PP_ALIGN.CENTER,
+                FONT_SIZE_H2,
+                FONT_BODY,
+                BRAND_DARK_GREY,
+                auto_size=MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT,
             )
-            subtitle_frame = subtitle_shape.text_frame
-            subtitle_frame.word_wrap = True
-            subtitle_frame.auto_size = MSO_AUTO_SIZE.SHAPE_TO_FIT_TEXT
-
-            subtitle_para = subtitle_frame.paragraphs[0]
-            subtitle_para.alignment = PP_ALIGN.CENTER
-            subtitle_run = subtitle_para.add_run()
-            subtitle_run.text = slide_data.subtitle
-            subtitle_run.font.size = FONT_SIZE_H2
-            subtitle_run.font.name = FONT_BODY
-            subtitle_run.font.color.rgb = BRAND_DARK_GREY  # Dark grey (issue #4)
 
         # Add logo to slide
         self._add_logo_to_slide(slide)
@@ -335,52 +693,32 @@ class MarkdownToPptxConverter:
         Args:
             slide_data: The slide data to render.
         """
-        blank_layout = self._prs.slide_layouts[6]  # Blank layout
-        slide = self._prs.slides.add_slide(blank_layout)
-
-        # Apply brand background
-        self._set_slide_background(slide)
+        slide = self._new_slide()
 
         # Determine layout based on whether slide has an image
         has_image = slide_data.image is not None
 
         # Title text box
-        title_left = Inches(0.5)
-        title_top = Inches(0.4)
-        title_width = Inches(12.333)
-        title_height = Inches(0.8)
-
-        title_shape = slide.shapes.add_textbox(
-            title_left, title_top, title_width, title_height
+        self._add_text_shape(
+            slide,
+            (TEXT_LEFT, CONTENT_TITLE_TOP, TEXT_WIDTH, CONTENT_TITLE_HEIGHT),
+            slide_data.title,
+            PP_ALIGN.LEFT,
+            FONT_SIZE_H2,
+            FONT_HEADER,
+            BRAND_WOODSMOKE,
+            bold=True,
         )
-        title_frame = title_shape.text_frame
-        title_frame.word_wrap = True
-
-        title_para = title_frame.paragraphs[0]
-        title_para.alignment = PP_ALIGN.LEFT
-        title_run = title_para.add_run()
-        title_run.text = slide_data.title
-        title_run.font.size = FONT_SIZE_H2
-        title_run.font.bold = True
-        title_run.font.name = FONT_HEADER
-        title_run.font.color.rgb = BRAND_WOODSMOKE
 
         # Content text box - half width if image present, full width otherwise
-        content_left = Inches(0.5)
-        content_top = Inches(1.4)
-        if has_image:
-            content_width = Inches(5.666)  # Half of slide width minus margins
-        else:
-            content_width = Inches(12.333)
-        content_height = Inches(5.6)
+        content_width = CONTENT_WIDTH_WITH_IMAGE if has_image else TEXT_WIDTH
 
-        content_shape = slide.shapes.add_textbox(
-            content_left, content_top, content_width, content_height
-        )
-        content_frame = content_shape.text_frame
-        content_frame.word_wrap = True
         # Auto-shrink text to fit within slide boundaries (issue #7)
-        content_frame.auto_size = MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE
+        content_frame = self._add_text_frame(
+            slide,
+            (TEXT_LEFT, CONTENT_TOP, content_width, CONTENT_HEIGHT),
+            auto_size=MSO_AUTO_SIZE.TEXT_TO_FIT_SHAPE,
+        )
 
         self._render_content(content_frame, slide_data.content)
 
@@ -396,136 +734,117 @@ class MarkdownToPptxConverter:
     ) -> None:
         """Render content to a text frame.
 
+        Paragraphs are written straight into the frame's ``p:txBody`` as
+        ``a:p`` elements instead of through python-pptx paragraph and run
+        proxies.
+
         Args:
             text_frame: The PowerPoint text frame to render to.
             content: The list of content items to render.
         """
-        first_item = True
+        if not content:
+            return
+
+        txBody = text_frame._txBody
+        part = text_frame.part
+
+        # Drop the empty paragraph every new text box starts with
+        for empty_p in txBody.findall(_QN_P):
+            txBody.remove(empty_p)
 
+        # Build every paragraph detached, then attach them in one call
+        renderers = self._content_renderers
+        paragraphs = []
         for item in content:
-            if isinstance(item, ListItem):
-                if first_item:
-                    para = text_frame.paragraphs[0]
-                    first_item = False
-                else:
-                    para = text_frame.add_paragraph()
-
-                # Set indentation based on level
-                para.level = item.level
-
-                # Configure paragraph properties for proper list formatting
-                pPr = para._p.get_or_add_pPr()
-
-                # Remove any existing bullet settings
-                for child in list(pPr):
-                    tag_name = etree.QName(child.tag).localname if isinstance(child.tag, str) else ''
-                    if tag_name.startswith('bu'):
-                        pPr.remove(child)
-
-                # Set indentation for PowerPoint-native hanging indentation (issue #12)
-                # marL = left margin (where bullet sits)
-                # indent = negative for hanging (text starts to the right of bullet)
-                indent_per_level = Inches(0.5)
-                left_margin = int(indent_per_level.emu * (item.level + 1))
-                hanging_indent = int(Inches(0.25).emu)
-                pPr.set(qn('a:marL'), str(left_margin))
-                pPr.set(qn('a:indent'), str(-hanging_indent))  # Negative = hanging indent
-
-                if item.ordered:
-                    # Numbered list using buAutoNum
-                    buAutoNum = etree.SubElement(pPr, qn('a:buAutoNum'))
-                    # Use different numbering styles for different levels
-                    if item.level == 0:
-                        buAutoNum.set('type', 'arabicPeriod')  # 1. 2. 3.
-                    else:
-                        buAutoNum.set('type', 'alphaLcPeriod')  # a. b. c.
-                else:
-                    # Bullet point using buChar
-                    buChar = etree.SubElement(pPr, qn('a:buChar'))
-                    bullet_char = BULLET_CHARS[min(item.level, len(BULLET_CHARS) - 1)]
-                    buChar.set('char', bullet_char)
-
-                # Add line spacing - half space between lines (issue #4)
-                # Use space_after to add spacing after each paragraph
-                para.space_after = Pt(9)  # Half of 18pt = 9pt extra space
-
-                # Determine text color based on nesting level (issue #3)
-                text_color = BRAND_DARK_GREY if item.level > 0 else BRAND_WOODSMOKE
-
-                # No extra spaces after bullet/number per issue #1
-                # The indentation is handled by paragraph properties (marL, indent)
-
-                # Add content with formatting
-                for text_run in item.content:
-                    run = para.add_run()
-                    run.text = text_run.text
-                    run.font.size = FONT_SIZE_BODY
-                    run.font.name = FONT_BODY
-                    run.font.bold = text_run.bold
-                    run.font.italic = text_run.italic
-                    # Apply hyperlink styling if URL present
-                    if text_run.url:
-                        run.hyperlink.address = text_run.url
-                        run.font.color.rgb = LINK_COLOR
-                        run.font.underline = True
-                    else:
-                        run.font.color.rgb = text_color
-
-            elif isinstance(item, SectionTitle):
-                if first_item:
-                    para = text_frame.paragraphs[0]
-                    first_item = False
-                else:
-                    para = text_frame.add_paragraph()
-
-                # Add half line space before and after section titles (issue #8)
-                para.space_before = Pt(9)  # Half of 18pt = 9pt before
-                para.space_after = Pt(9)   # Half of 18pt = 9pt after
-
-                run = para.add_run()
-                run.text = item.text
-                run.font.size = FONT_SIZE_BODY
-                run.font.name = FONT_BODY
-                run.font.bold = True  # Section titles are always bold
-
-                # H3 (level 3) = bold red, H4 (level 4) = bold black (issue #8)
-                if item.level == 3:
-                    run.font.color.rgb = BRAND_RED  # #FF0000
-                else:
-                    run.font.color.rgb = BRAND_WOODSMOKE  # Black/dark
-
-            elif isinstance(item, TextRun):
-                if first_item:
-                    para = text_frame.paragraphs[0]
-                    first_item = False
-                else:
-                    para = text_frame.add_paragraph()
-
-                # Add line spacing - half space between lines (issue #4)
-                para.space_after = Pt(9)  # Half of 18pt = 9pt extra space
-
-                run = para.add_run()
-                run.text = item.text
-                run.font.size = FONT_SIZE_BODY
-                run.font.name = FONT_BODY
-                run.font.bold = item.bold
-                run.font.italic = item.italic
-                # Apply hyperlink styling if URL present
-                if item.url:
-                    run.hyperlink.address = item.url
-                    run.font.color.rgb = LINK_COLOR
-                    run.font.underline = True
-                else:
-                    run.font.color.rgb = BRAND_WOODSMOKE
-
-
-def convert_file(input_path: str, output_path: str | None = None) -> str:
+            renderer = renderers.get(type(item)) or self._find_renderer(type(item))
+            if renderer is None:
+                # Not a content type this converter knows how to draw
+                continue
+            p = OxmlElement('a:p')
+            renderer(p, part, item)
+            paragraphs.append(p)
+        txBody.extend(paragraphs)
+
+    def _find_renderer(self, item_type: type):
+        """Find the renderer for a content type not registered exactly.
+
+        Subclasses of the parser's content types use their base class's
+        renderer, which is then registered for the subclass too.
+
+        Args:
+            item_type: The type of the content item.
+
+        Returns:
+            The paragraph renderer, or None if the type is not renderable.
+        """
+        for base_type, renderer in list(self._content_renderers.items()):
+            if issubclass(item_type, base_type):
+                self._content_renderers[item_type] = renderer
+                return renderer
+        return None
+
+    def _render_list_item(self, p, part, item: ListItem) -> None:
+        """Render a bullet or numbered list item into a paragraph.
+
+        Args:
+            p: The ``a:p`` paragraph element.
+            part: The slide part owning hyperlink relationships.
+            item: The list item to render.
+        """
+        p.append(deepcopy(_list_ppr_template(item.level, item.ordered)))
+
+        # Determine text color based on nesting level (issue #3)
+        text_color = BRAND_DARK_GREY if item.level > 0 else BRAND_WOODSMOKE
+
+        # No extra spaces after bullet/number per issue #1
+        # The indentation is handled by paragraph properties (marL, indent)
+
+        # Add content with formatting
+        self._add_text_runs(p, part, item.content, text_color)
+
+    def _render_section_title(self, p, part, item: SectionTitle) -> None:
+        """Render an H3/H4 section title into a paragraph.
+
+        Args:
+            p: The ``a:p`` paragraph element.
+            part: The slide part (unused; kept for a uniform signature).
+            item: The section title to render.
+        """
+        # Add half line space before and after section titles (issue #8)
+        p.append(deepcopy(_spaced_ppr_template(space_before=True)))
+
+        # H3 (level 3) = bold red, H4 (level 4) = bold black (issue #8)
+        # Section titles are always bold
+        color = BRAND_RED if item.level == 3 else BRAND_WOODSMOKE
+        self._add_run(p, item.text, FONT_SIZE_BODY, FONT_BODY, color, bold=True)
+
+    def _render_text_run(self, p, part, item: TextRun) -> None:
+        """Render a plain text run as its own paragraph.
+
+        Args:
+            p: The ``a:p`` paragraph element.
+            part: The slide part owning hyperlink relationships.
+            item: The text run to render.
+        """
+        # Add line spacing - half space between lines (issue #4)
+        p.append(deepcopy(_spaced_ppr_template(space_before=False)))
+
+        self._add_text_runs(p, part, [item], BRAND_WOODSMOKE)
+
+
+def convert_file(
+    input_path: str,
+    output_path: str | None = None,
+    converter: MarkdownToPptxConverter | None = None,
+) -> str:
     """Convert a markdown file to PPTX.
 
     Args:
         input_path: Path to the markdown file.
         output_path: Optional path for the output PPTX. If not provided,
             uses the same name as input with .pptx extension.
+        converter: Optional converter to reuse across calls. If not
+            provided, a new one is created.
 
     Returns:
         The absolute path to the created PPTX file.
@@ -544,18 +863,53 @@ def convert_file(input_path: str, output_path: str | None = None) -> str:
         raise ValidationError("Input path cannot be empty")
 
     path = Path(input_path)
-    if not path.exists():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    if not path.is_file():
+    # One stat covers both checks the old exists()/isfile() pair made.
+    # Only regular files are read: opening a FIFO would block, and a
+    # directory fails differently per platform.
+    try:
+        mode = path.stat().st_mode
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Input file not found: {input_path}") from None
+    if not stat.S_ISREG(mode):
         raise ValidationError(f"Input path is not a file: {input_path}")
-
-    # Read markdown content
-    content = path.read_text(encoding="utf-8")
+    raw = path.read_bytes()
+    content = raw.decode("utf-8")
 
     # Determine output path
     if output_path is None:
         output_path = str(path.with_suffix(".pptx"))
 
-    converter = MarkdownToPptxConverter()
+    if converter is None:
+        converter = MarkdownToPptxConverter()
     return converter.convert(content, output_path)
+
+
+def convert_many(
+    pairs: Sequence[Tuple[str, Optional[str]]], workers: Optional[int] = None
+) -> List[str]:
+    """Convert several markdown files to PPTX in parallel worker processes.
+
+    Each conversion is independent, so files are spread across a process
+    pool with one convert_file() call per pair.
+
+    Args:
+        pairs: (input_path, output_path) tuples. An output_path of None uses
+            the input name with a .pptx extension, as in convert_file().
+        workers: Maximum number of worker processes. Defaults to the number
+            of CPUs.
+
+    Returns:
+        The absolute paths of the created PPTX files, in input order.
+
+    Raises:
+        ValidationError: If any input file or output path is invalid.
+        FileNotFoundError: If any input file doesn't exist.
+    """
+    if not pairs:
+        return []
+
+    input_paths = [input_path for input_path, _ in pairs]
+    output_paths = [output_path for _, output_path in pairs]
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(convert_file, input_paths, output_paths))
@@ -3,8 +3,39 @@
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
-from typing import List, Optional
+from functools import lru_cache
+from typing import Iterator, List, Optional, Tuple
+
+# Parsed items are created per line and per inline span; slots (Python 3.10+)
+# drop the per-instance __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Content line patterns, matched against a right-stripped line
+_IMAGE_RE = re.compile(r"^!\[([^\]]*)\]\(([^)]+)\)$")
+_SECTION_RE = re.compile(r"^(#{3,4})\s+(.+)$")
+
+# List markers; a one-character slice is tested against these, so an empty
+# slice must not match
+_BULLET_MARKERS = ("-", "*", "+")
+_NUMBER_TERMINATORS = (".", ")")
+
+# Inline formatting: a link, or an emphasis span closed by the same
+# delimiter that opened it (1 = italic, 2 = bold, 3 = bold + italic).
+# The greedy opener tries the longest delimiter first. Both alternatives
+# are scanned in one pass; match.lastgroup names the one that matched.
+# Link pattern: [caption](url) - caption can be empty. The caption may not
+# contain "[" and the URL allows only one level of balanced parentheses
+# (e.g. Wikipedia's "Foo_(bar)"), so a failed attempt stops at the next
+# opener instead of rescanning to the end of the line; this keeps lines
+# with many unclosed "[" or "](" linear rather than quadratic.
+_LINK_PATTERN = (
+    r"(?P<link>\[(?P<caption>[^\[\]]*)\]"
+    r"\((?P<url>(?:[^()]|\([^()]*\))+)\))"
+)
+_EMPHASIS_PATTERN = r"(?P<delimiter>\*{1,3}|_{1,3})(?P<emphasis>.+?)(?P=delimiter)"
+_INLINE_RE = re.compile(f"{_LINK_PATTERN}|{_EMPHASIS_PATTERN}")
 
 
 class ValidationError(Exception):
@@ -13,7 +44,7 @@ class ValidationError(Exception):
     pass
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TextRun:
     """A run of text with formatting."""
 
@@ -23,7 +54,7 @@ class TextRun:
     url: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Image:
     """An image with optional caption."""
 
@@ -31,7 +62,15 @@ class Image:
     caption: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
+class SectionTitle:
+    """A section heading (H3/H4) inside a content slide."""
+
+    text: str
+    level: int = 3
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class ListItem:
     """A list item with optional nesting."""
 
@@ -41,12 +80,12 @@ class ListItem:
     number: Optional[int] = None
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Slide:
     """Represents a single slide."""
 
     title: str
-    content: List[ListItem | TextRun] = field(default_factory=list)
+    content: List[ListItem | TextRun | SectionTitle] = field(default_factory=list)
     is_title_slide: bool = False
     subtitle: Optional[str] = None
     image: Optional[Image] = None
@@ -81,7 +120,7 @@ class MarkdownParser:
             raise ValidationError(
                 f"Content must be a string, got {type(content).__name__}"
             )
-        if not content.strip():
+        if not content or content.isspace():
             raise ValidationError("Content cannot be empty")
 
     def parse(self) -> List[Slide]:
@@ -93,67 +132,81 @@ class MarkdownParser:
         Raises:
             ValidationError: If no H1 heading is found.
         """
-        lines = self.content.split("\n")
-        self.slides = []
+        self.slides = list(self.iter_slides())
+        return self.slides
 
-        current_slide: Optional[Slide] = None
-        collecting_subtitle = False
-        subtitle_lines: List[str] = []
+    def iter_slides(self) -> Iterator[Slide]:
+        """Parse the markdown content, yielding each slide once it is complete.
 
-        i = 0
-        while i < len(lines):
-            line = lines[i]
+        A slide is complete when the next heading or the end of the document
+        is reached, so title slides are yielded with their subtitle set.
 
-            # Check for H1 (title slide)
-            if line.startswith("# ") and not line.startswith("## "):
-                title = line[2:].strip()
-                current_slide = Slide(
-                    title=title, is_title_slide=True, content=[], subtitle=None
-                )
-                self.slides.append(current_slide)
-                collecting_subtitle = True
-                subtitle_lines = []
-                i += 1
-                continue
+        Yields:
+            Slide objects in document order.
 
-            # Check for H2 (content slide)
-            if line.startswith("## "):
-                if collecting_subtitle and subtitle_lines:
+        Raises:
+            ValidationError: If no heading is found. Raised once the input is
+                exhausted, as nothing has been yielded by then.
+        """
+        current_slide: Optional[Slide] = None
+        subtitle_lines: List[str] = []
+        # Bound once; looked up on every content line otherwise
+        parse_content_line = self._parse_content_line
+
+        for line in self.content.splitlines():
+            # Check for H2 (content slide) or H1 (title slide); the cheap
+            # first-character guard skips both checks for ordinary lines
+            is_heading = False
+            if line[:1] == "#":
+                is_h2 = line.startswith("## ")
+                is_heading = is_h2 or line.startswith("# ")
+            if is_heading:
+                if current_slide is not None:
                     # Finalize subtitle for previous title slide
-                    if self.slides and self.slides[0].is_title_slide:
-                        self.slides[0].subtitle = "\n".join(subtitle_lines).strip()
-                collecting_subtitle = False
+                    self._finalize_subtitle(current_slide, subtitle_lines)
+                    yield current_slide
                 subtitle_lines = []
 
-                title = line[3:].strip()
-                current_slide = Slide(title=title, is_title_slide=False, content=[])
-                self.slides.append(current_slide)
-                i += 1
+                if is_h2:
+                    title = line[3:].strip()
+                    current_slide = Slide(title=title, is_title_slide=False, content=[])
+                else:
+                    title = line[2:].strip()
+                    current_slide = Slide(
+                        title=title, is_title_slide=True, content=[], subtitle=None
+                    )
                 continue
 
             # Handle content
             if current_slide is not None:
-                if collecting_subtitle and current_slide.is_title_slide:
+                if current_slide.is_title_slide:
                     # Collect subtitle content
-                    if line.strip():
-                        subtitle_lines.append(line.strip())
-                elif not current_slide.is_title_slide:
+                    subtitle_line = line.strip()
+                    if subtitle_line:
+                        subtitle_lines.append(subtitle_line)
+                else:
                     # Parse content for content slides
-                    self._parse_content_line(line, current_slide)
-
-            i += 1
-
-        # Finalize any remaining subtitle
-        if collecting_subtitle and subtitle_lines and self.slides:
-            if self.slides[0].is_title_slide:
-                self.slides[0].subtitle = "\n".join(subtitle_lines).strip()
+                    parse_content_line(line, current_slide)
 
-        if not self.slides:
+        if current_slide is None:
             raise ValidationError(
                 "Document must contain at least one heading (# or ##)"
             )
 
-        return self.slides
+        # Finalize any remaining subtitle
+        self._finalize_subtitle(current_slide, subtitle_lines)
+        yield current_slide
+
+    def _finalize_subtitle(self, slide: Slide, subtitle_lines: List[str]) -> None:
+        """Set a title slide's subtitle from its collected lines, if any.
+
+        Args:
+            slide: The slide the lines were collected for.
+            subtitle_lines: Non-empty, already stripped subtitle lines.
+        """
+        if subtitle_lines:
+            # Lines are stripped and non-empty, so the join needs no strip
+            slide.subtitle = "\n".join(subtitle_lines)
 
     def _parse_content_line(self, line: str, slide: Slide) -> None:
         """Parse a content line and add to slide.
@@ -163,43 +216,66 @@ class MarkdownParser:
             slide: The slide to add content to.
         """
         stripped = line.rstrip()
-
-        # Check for image syntax: ![caption](image_path)
-        image_match = re.match(r"^!\[([^\]]*)\]\(([^)]+)\)$", stripped)
-        if image_match:
-            caption = image_match.group(1) or None
-            path = image_match.group(2)
-            slide.image = Image(path=path, caption=caption)
+        # Blank lines separate blocks but add no content
+        if not stripped:
             return
 
+        # Check for image syntax: ![caption](image_path); the pattern is
+        # anchored at "!", so other lines skip the regex
+        if stripped[:1] == "!":
+            image_match = _IMAGE_RE.match(stripped)
+            if image_match:
+                caption = image_match.group(1) or None
+                path = image_match.group(2)
+                slide.image = Image(path=path, caption=caption)
+                return
+
+        # Check for section title (H3/H4); most lines fail the first-character
+        # test and never reach the regex
+        if stripped[:1] == "#":
+            section_match = _SECTION_RE.match(stripped)
+            if section_match:
+                level = len(section_match.group(1))
+                slide.content.append(
+                    SectionTitle(text=section_match.group(2).strip(), level=level)
+                )
+                return
+
+        # List markers are found with plain string checks rather than a regex:
+        # indentation, then a marker, then at least one whitespace character
+        # ("-", "*" or "+" for bullets; digits and "." or ")" for numbers).
+        # stripped has no trailing whitespace, so text always follows.
+        marked = stripped.lstrip()
+        indent = len(stripped) - len(marked)
+
         # Check for bullet list
-        bullet_match = re.match(r"^(\s*)[-*+]\s+(.+)$", stripped)
-        if bullet_match:
-            indent = len(bullet_match.group(1))
+        if marked[:1] in _BULLET_MARKERS and marked[1:2].isspace():
             level = indent // 2  # 2 spaces per indent level
-            content_text = bullet_match.group(2)
+            content_text = marked[1:].lstrip()
             text_runs = self._parse_inline_formatting(content_text)
             slide.content.append(ListItem(content=text_runs, level=level, ordered=False))
             return
 
         # Check for numbered list
-        numbered_match = re.match(r"^(\s*)(\d+)[.)]\s+(.+)$", stripped)
-        if numbered_match:
-            indent = len(numbered_match.group(1))
+        digits_end = 0
+        while marked[digits_end : digits_end + 1].isdecimal():
+            digits_end += 1
+        if (
+            digits_end
+            and marked[digits_end : digits_end + 1] in _NUMBER_TERMINATORS
+            and marked[digits_end + 1 : digits_end + 2].isspace()
+        ):
             level = indent // 2
-            number = int(numbered_match.group(2))
-            content_text = numbered_match.group(3)
+            number = int(marked[:digits_end])
+            content_text = marked[digits_end + 1 :].lstrip()
             text_runs = self._parse_inline_formatting(content_text)
             slide.content.append(
                 ListItem(content=text_runs, level=level, ordered=True, number=number)
             )
             return
 
-        # Plain text (non-empty)
-        if stripped:
-            text_runs = self._parse_inline_formatting(stripped)
-            for run in text_runs:
-                slide.content.append(run)
+        # Plain text
+        slide.content.extend(self._parse_inline_formatting(stripped))
 
     def _parse_inline_formatting(self, text: str) -> List[TextRun]:
         """Parse inline formatting (bold, italic, URLs) in text.
@@ -210,51 +286,68 @@ class MarkdownParser:
         Returns:
             List of TextRun objects with formatting applied.
         """
-        runs: List[TextRun] = []
-
-        # First, handle markdown links [caption](url)
-        # Then handle bold+italic, bold, or italic
-        # Order matters: check longer patterns first
-        # Link pattern: [caption](url) - caption can be empty
-        link_pattern = r"\[([^\]]*)\]\(([^)]+)\)"
-        format_pattern = r"(\*\*\*|___)(.+?)(\*\*\*|___)|(\*\*|__)(.+?)(\*\*|__)|(\*|_)(.+?)(\*|_)"
-
-        # Combined pattern: links first, then formatting
-        combined_pattern = f"({link_pattern})|{format_pattern}"
-
-        pos = 0
-        for match in re.finditer(combined_pattern, text):
-            # Add any text before this match as plain text
-            if match.start() > pos:
-                plain_text = text[pos : match.start()]
-                if plain_text:
-                    runs.append(TextRun(text=plain_text))
-
-            # Check if this is a link match
-            if match.group(1):  # Link match [caption](url)
-                caption = match.group(2)
-                url = match.group(3)
-                # Use URL as display text if caption is empty
-                display_text = caption if caption else url
-                runs.append(TextRun(text=display_text, url=url))
-            # Determine formatting type (groups shifted by 3 due to link pattern)
-            elif match.group(4):  # Bold + Italic (*** or ___)
-                runs.append(TextRun(text=match.group(5), bold=True, italic=True))
-            elif match.group(7):  # Bold (** or __)
-                runs.append(TextRun(text=match.group(8), bold=True, italic=False))
-            elif match.group(10):  # Italic (* or _)
-                runs.append(TextRun(text=match.group(11), bold=False, italic=True))
-
-            pos = match.end()
-
-        # Add any remaining text
-        if pos < len(text):
-            remaining = text[pos:]
-            if remaining:
-                runs.append(TextRun(text=remaining))
-
-        # If no formatting found, return single plain run
-        if not runs:
-            runs.append(TextRun(text=text))
-
-        return runs
+        # Most lines carry no markup; skip the regex when no link or emphasis
+        # delimiter is present
+        if "*" not in text and "_" not in text and "[" not in text:
+            return [TextRun(text=text)]
+
+        # TextRuns are mutable, so each call gets fresh instances built from
+        # the cached (immutable) token tuples
+        return [TextRun(*token) for token in _tokenize_inline(text)]
+
+
+# (text, bold, italic, url) for one inline run
+_InlineToken = Tuple[str, bool, bool, Optional[str]]
+
+
+@lru_cache(maxsize=4096)
+def _tokenize_inline(text: str) -> Tuple[_InlineToken, ...]:
+    """Split marked-up text into formatted runs, caching repeated text.
+
+    Args:
+        text: The text to parse.
+
+    Returns:
+        Tuple of (text, bold, italic, url) tokens in order.
+    """
+    tokens: List[_InlineToken] = []
+    append = tokens.append
+
+    pos = 0
+    for match in _INLINE_RE.finditer(text):
+        # Add any text before this match as plain text
+        if match.start() > pos:
+            plain_text = text[pos : match.start()]
+            if plain_text:
+                append((plain_text, False, False, None))
+
+        if match.lastgroup == "link":  # [caption](url)
+            caption, url = match.group("caption", "url")
+            # Use URL as display text if caption is empty
+            display_text = caption if caption else url
+            append((display_text, False, False, url))
+        else:
+            # Emphasis: delimiter length picks the formatting
+            delimiter_length = len(match.group("delimiter"))
+            append(
+                (
+                    match.group("emphasis"),
+                    delimiter_length >= 2,  # ** / __ or *** / ___
+                    delimiter_length != 2,  # * / _ or *** / ___
+                    None,
+                )
+            )
+
+        pos = match.end()
+
+    # Add any remaining text
+    if pos < len(text):
+        remaining = text[pos:]
+        if remaining:
+            append((remaining, False, False, None))
+
+    # If no formatting found, return single plain run
+    if not tokens:
+        append((text, False, False, None))
+
+    return tuple(tokens)
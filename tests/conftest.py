@@ -0,0 +1,41 @@
+"""Shared pytest fixtures."""
+
+import io
+from functools import lru_cache
+
+import pytest
+from pptx import Presentation
+
+from md2slides.converter import MarkdownToPptxConverter
+
+
+@pytest.fixture(scope="session")
+def converter():
+    """A default converter shared by all tests.
+
+    convert() resets all per-presentation state, so one instance can serve
+    every test that does not need a custom logo path.
+    """
+    return MarkdownToPptxConverter()
+
+
+@pytest.fixture(scope="session")
+def render(converter):
+    """Convert markdown in memory and open the result as a Presentation.
+
+    Tests that are not about file output use this to skip the round trip
+    through a temporary directory. The saved bytes are cached per markdown
+    string, so inputs shared between tests are converted once; each call
+    still opens a fresh Presentation, as tests may mutate it.
+    """
+
+    @lru_cache(maxsize=64)
+    def _render_bytes(markdown_content):
+        stream = io.BytesIO()
+        converter.convert_to_stream(markdown_content, stream)
+        return stream.getvalue()
+
+    def _render(markdown_content):
+        return Presentation(io.BytesIO(_render_bytes(markdown_content)))
+
+    return _render
@@ -1,6 +1,8 @@
 """Tests for the CLI."""
 
 import os
+import subprocess
+import sys
 import tempfile
 
 import pytest
@@ -51,6 +53,62 @@ class TestCLI:
             result = main([input_path])
             assert result == 1
 
+    def test_main_with_multiple_inputs(self):
+        """CLI should convert every input next to its source file."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_paths = []
+            for name in ("first", "second"):
+                input_path = os.path.join(tmpdir, f"{name}.md")
+                with open(input_path, "w") as f:
+                    f.write(f"# {name}\n\n## Slide\n\nContent")
+                input_paths.append(input_path)
+
+            result = main(input_paths)
+
+            assert result == 0
+            assert os.path.exists(os.path.join(tmpdir, "first.pptx"))
+            assert os.path.exists(os.path.join(tmpdir, "second.pptx"))
+
+    def test_main_continues_after_failed_input(self):
+        """A failing input should not stop the remaining conversions."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            input_path = os.path.join(tmpdir, "valid.md")
+            with open(input_path, "w") as f:
+                f.write("# Test\n\n## Slide\n\nContent")
+
+            result = main(["/nonexistent/file.md", input_path])
+
+            assert result == 1
+            assert os.path.exists(os.path.join(tmpdir, "valid.pptx"))
+
+    def test_main_with_unreadable_logo(self, monkeypatch, capsys):
+        """A logo that cannot be read should be reported, not crash the CLI."""
+        from md2slides.converter import MarkdownToPptxConverter
+
+        with tempfile.TemporaryDirectory() as tmpdir:
+            # A directory where the logo file should be makes the read fail
+            monkeypatch.setattr(
+                MarkdownToPptxConverter,
+                "_find_logo_path",
+                lambda self, logo_path=None: tmpdir,
+            )
+            input_path = os.path.join(tmpdir, "input.md")
+            with open(input_path, "w") as f:
+                f.write("# Test\n\n## Slide\n\nContent")
+
+            result = main([input_path])
+
+        assert result == 1
+        assert "Unexpected error" in capsys.readouterr().err
+
+    def test_main_output_with_multiple_inputs(self, capsys):
+        """-o should be rejected when more than one input is given."""
+        with pytest.raises(SystemExit) as exc_info:
+            main(["a.md", "b.md", "-o", "out.pptx"])
+
+        assert exc_info.value.code == 2
+        assert "single input" in capsys.readouterr().err
+
     def test_main_version(self, capsys):
         """CLI should show version."""
         with pytest.raises(SystemExit) as exc_info:
@@ -59,3 +117,21 @@ class TestCLI:
         assert exc_info.value.code == 0
         captured = capsys.readouterr()
         assert "0.1.0" in captured.out
+
+    def test_version_does_not_import_converter(self):
+        """--version should not load python-pptx or the converter."""
+        code = (
+            "import sys\n"
+            "from md2slides.cli import main\n"
+            "try:\n"
+            "    main(['--version'])\n"
+            "except SystemExit:\n"
+            "    pass\n"
+            "assert 'md2slides.converter' not in sys.modules\n"
+            "assert 'pptx' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True
+        )
+
+        assert result.returncode == 0, result.stderr
@@ -1,11 +1,14 @@
 """Tests for the markdown parser."""
 
+import time
+
 import pytest
 
 from md2slides.parser import (
     Image,
     ListItem,
     MarkdownParser,
+    SectionTitle,
     Slide,
     TextRun,
     ValidationError,
@@ -85,6 +88,47 @@ Financial Summary
         assert slides[0].subtitle == "Q3 2024\nFinancial Summary"
 
 
+class TestIterSlides:
+    """Test streaming slide iteration."""
+
+    def test_yields_title_slide_with_subtitle(self):
+        """Title slide should be yielded only once its subtitle is complete."""
+        content = """# Quarterly Report
+
+Q3 2024
+
+## Agenda
+
+- Item
+"""
+        slides = MarkdownParser(content).iter_slides()
+
+        title_slide = next(slides)
+        assert title_slide.is_title_slide is True
+        assert title_slide.subtitle == "Q3 2024"
+
+        content_slide = next(slides)
+        assert content_slide.title == "Agenda"
+        assert len(content_slide.content) == 1
+
+        with pytest.raises(StopIteration):
+            next(slides)
+
+    def test_matches_parse(self):
+        """iter_slides() should produce the same slides as parse()."""
+        content = "# Title\n\nSub\n\n## One\n\nText\n\n## Two\n\n1. First"
+
+        assert list(MarkdownParser(content).iter_slides()) == MarkdownParser(
+            content
+        ).parse()
+
+    def test_no_headings_raises_error(self):
+        """Iterating content without headings should raise ValidationError."""
+        parser = MarkdownParser("Just some text without any headings")
+        with pytest.raises(ValidationError, match="at least one heading"):
+            list(parser.iter_slides())
+
+
 class TestContentSlides:
     """Test content slide parsing."""
 
@@ -300,6 +344,35 @@ class TestInlineFormatting:
         assert runs[2].text == "italic"
         assert runs[2].italic is True
 
+    def test_emphasis_closes_on_matching_delimiter(self):
+        """Emphasis should only close on the delimiter that opened it."""
+        content = """## Slide
+
+- *star_ text
+"""
+        slides = MarkdownParser(content).parse()
+
+        runs = slides[0].content[0].content
+        assert len(runs) == 1
+        assert runs[0].text == "*star_ text"
+        assert runs[0].italic is False
+
+    def test_repeated_text_gets_independent_runs(self):
+        """Identical formatted lines should not share TextRun instances."""
+        content = """## Slide
+
+- **Status** done
+- **Status** done
+"""
+        slides = MarkdownParser(content).parse()
+
+        first, second = (item.content for item in slides[0].content)
+        assert first == second
+        assert first[0] is not second[0]
+
+        first[0].text = "Changed"
+        assert second[0].text == "Status"
+
 
 class TestPlainText:
     """Test plain text content."""
@@ -418,6 +491,67 @@ class TestUrlParsing:
         assert runs[3].text == "Bing"
         assert runs[3].url == "https://bing.com"
 
+    def test_link_after_unclosed_bracket(self):
+        """An unclosed "[" before a link should stay plain text."""
+        parser = MarkdownParser("## Slide\n\n- See [notes [here](https://example.com)\n")
+        slides = parser.parse()
+
+        runs = slides[0].content[0].content
+        assert runs[0].text == "See [notes "
+        assert runs[0].url is None
+        assert runs[1].text == "here"
+        assert runs[1].url == "https://example.com"
+
+    def test_url_with_parentheses(self):
+        """Balanced parentheses inside a URL should stay part of the link."""
+        content = """## Slide
+
+- See [Foo](https://en.wikipedia.org/wiki/Foo_(bar)) for details
+"""
+        parser = MarkdownParser(content)
+        slides = parser.parse()
+
+        runs = slides[0].content[0].content
+        assert runs[1].text == "Foo"
+        assert runs[1].url == "https://en.wikipedia.org/wiki/Foo_(bar)"
+        assert runs[2].text == " for details"
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            pytest.param("[x](https://a/b_(c)", id="unbalanced"),
+            pytest.param("[x](f((x)))", id="nested"),
+        ],
+    )
+    def test_url_with_unsupported_parentheses_stays_text(self, text):
+        """Unbalanced or nested URL parentheses should leave the link as text."""
+        parser = MarkdownParser(f"## Slide\n\n{text}\n")
+        slides = parser.parse()
+
+        runs = slides[0].content
+        assert [(run.text, run.url) for run in runs] == [(text, None)]
+
+    def test_many_unclosed_brackets_parse_in_linear_time(self):
+        """Runs of unclosed link syntax should not backtrack quadratically."""
+
+        def parse_seconds(count):
+            # Best of three; each attempt gets a distinct line so the inline
+            # cache cannot answer it
+            best = float("inf")
+            for attempt in range(3):
+                line = "[a](" * count + "[" * (4 * count) + str(attempt)
+                parser = MarkdownParser(f"## Slide\n\n{line}\n")
+
+                start = time.perf_counter()
+                slides = parser.parse()
+                best = min(best, time.perf_counter() - start)
+
+                assert "".join(run.text for run in slides[0].content) == line
+            return best
+
+        # Linear scanning grows ~4x for 4x the input; quadratic grows ~16x
+        assert parse_seconds(20000) < 10 * parse_seconds(5000)
+
     def test_url_in_plain_text(self):
         """URLs should work in plain text paragraphs."""
         content = """## Slide
@@ -548,3 +682,38 @@ class TestImageParsing:
         assert slides[0].image is not None
         assert slides[0].image.path == "second.png"
         assert slides[0].image.caption == "Second"
+
+
+class TestSectionTitleParsing:
+    """Test section title (H3/H4) parsing (issue #8)."""
+
+    def test_h3_creates_section_title(self):
+        """H3 inside a content slide should become a level-3 SectionTitle."""
+        content = """## Slide
+
+### Section Title
+
+- Content
+"""
+        parser = MarkdownParser(content)
+        slides = parser.parse()
+
+        assert len(slides) == 1
+        item = slides[0].content[0]
+        assert isinstance(item, SectionTitle)
+        assert item.text == "Section Title"
+        assert item.level == 3
+
+    def test_h4_creates_section_subtitle(self):
+        """H4 inside a content slide should become a level-4 SectionTitle."""
+        content = """## Slide
+
+#### Section Subtitle
+"""
+        parser = MarkdownParser(content)
+        slides = parser.parse()
+
+        item = slides[0].content[0]
+        assert isinstance(item, SectionTitle)
+        assert item.text == "Section Subtitle"
+        assert item.level == 4